@@ -36,7 +36,14 @@ setup(
     extras_require={
         "tests": [
             "pytest>=6.2.5,<7",
-            "pytest-cov>=3.0.0,<4"
+            "pytest-cov>=3.0.0,<4",
+            "coincurve>=13.0.0,<22"
+        ],
+        "coincurve": [
+            "coincurve>=13.0.0,<22"
+        ],
+        "orjson": [
+            "orjson>=3.0.0,<4"
         ],
         "docs": [
             "sphinx>=4.3.1,<5",
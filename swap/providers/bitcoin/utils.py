@@ -12,6 +12,7 @@ from btcpy.structs.script import (
     P2pkhScript, P2shScript
 )
 from base64 import b64decode
+from functools import lru_cache
 from typing import (
     Union, Optional, Tuple
 )
@@ -27,6 +28,17 @@ from ...exceptions import (
 )
 from ..config import bitcoin as config
 
+# Bitcoin networks by address first character, from the cryptos coins address/script prefixes
+_NETWORKS_BY_PREFIX: dict = {
+    prefix: network for network, coin in [
+        ("mainnet", cryptos.Bitcoin(testnet=False)), ("testnet", cryptos.Bitcoin(testnet=True))
+    ] for prefix in (list(coin.address_prefixes) + list(coin.script_prefixes))
+}
+# Bitcoin transaction raw prefix, base64 of the '{"' that every JSON object transaction raw starts with
+_TRANSACTION_RAW_PREFIX: str = "eyJ"
+# Bitcoin transaction raw minimum length, base64 of the shortest '{"type": "bitcoin_..."}' payload
+_TRANSACTION_RAW_MIN_LENGTH: int = 40
+
 
 def fee_calculator(transaction_input: int = 1, transaction_output: int = 1) -> int:
     """
@@ -113,30 +125,19 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
         raise TypeError(f"Address must be str, not '{type(address)}' type.")
     if address_type and address_type not in ["p2pkh", "p2sh"]:
         raise TypeError("Address type must be str and choose only 'p2pkh' or 'p2sh' types.")
-
-    if network is None:
-        for boolean in [True, False]:
-            valid = False
-            if cryptos.Bitcoin(testnet=boolean).is_address(address):
-                valid = True
-                break
-        if address_type:
-            valid = True if valid and (get_address_type(address=address) == address_type) else False
-        return valid
-
-    if not is_network(network=network):
+    if network is not None and not is_network(network=network):
         raise NetworkError(f"Invalid Bitcoin '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
 
-    valid: bool = False
-    if network == "mainnet":
-        valid = cryptos.Bitcoin(testnet=False).is_address(address)
-        if address_type:
-            valid = True if valid and (get_address_type(address=address) == address_type) else False
-    elif network == "testnet":
-        valid = cryptos.Bitcoin(testnet=True).is_address(address)
-        if address_type:
-            valid = True if valid and (get_address_type(address=address) == address_type) else False
+    return _is_address(address, network, address_type)
+
+
+@lru_cache(maxsize=1024)
+def _is_address(address: str, network: Optional[str] = None, address_type: Optional[str] = None) -> bool:
+    prefix_network: Optional[str] = _NETWORKS_BY_PREFIX.get(address[:1])
+    valid: bool = prefix_network is not None and (network is None or network == prefix_network)
+    if valid and address_type:
+        valid = get_address_type(address=address) == address_type
     return valid
 
 
@@ -158,6 +159,17 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     if not isinstance(transaction_raw, str):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
+    # Reject anything that can't be a base64 JSON object before decoding (and caching) it,
+    # surrounding whitespace is ignored like b64decode does
+    transaction_raw = transaction_raw.strip()
+    if len(transaction_raw) < _TRANSACTION_RAW_MIN_LENGTH or \
+            not transaction_raw.startswith(_TRANSACTION_RAW_PREFIX):
+        return False
+    return _is_transaction_raw(transaction_raw)
+
+
+@lru_cache(maxsize=256)
+def _is_transaction_raw(transaction_raw: str) -> bool:
     try:
         transaction_raw = clean_transaction_raw(transaction_raw)
         decoded_transaction_raw = b64decode(transaction_raw.encode())
@@ -288,20 +300,15 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
     {'fee': '...', 'type': '...', 'transaction_id': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
-        raise TransactionRawError("Invalid Bitcoin transaction raw.")
-
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+    url, data, loaded_transaction_raw = _prepare_submission(
+        transaction_raw=transaction_raw, endpoint=endpoint
+    )
+    response = requests.post(
+        url=url, data=json.dumps(data), headers=headers, timeout=timeout
+    )
+    response_json = response.json()
 
     if endpoint == "smartbit":
-        url = f"{config[loaded_transaction_raw['network']]['smartbit']}/pushtx"
-        data = dict(hex=loaded_transaction_raw["raw"])
-        response = requests.post(
-            url=url, data=json.dumps(data), headers=headers, timeout=timeout
-        )
-        response_json = response.json()
         if "success" in response_json and not response_json["success"]:
             raise APIError(response_json["error"]["message"], response_json["error"]["code"])
         elif "success" in response_json and response_json["success"]:
@@ -314,13 +321,7 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
             )
         else:
             raise APIError("Unknown Bitcoin submit payment error.")
-    elif endpoint == "sochain":
-        url = str(config[loaded_transaction_raw['network']]['sochain']).format(links="send_tx")
-        data = dict(tx_hex=loaded_transaction_raw["raw"])
-        response = requests.post(
-            url=url, data=json.dumps(data), headers=headers, timeout=timeout
-        )
-        response_json = response.json()
+    else:
         if "status" in response_json and response_json["status"] == "success":
             return dict(
                 fee=loaded_transaction_raw["fee"],
@@ -333,8 +334,26 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
             raise APIError(response_json["data"]["tx_hex"])
         else:
             raise APIError("Unknown Bitcoin submit payment error.")
-    else:
+
+
+def _prepare_submission(transaction_raw: str, endpoint: str = "sochain") -> Tuple[str, dict, dict]:
+    # Validate and decode transaction raw, then build the submit request url and body without any I/O
+    if endpoint not in ["smartbit", "sochain"]:
         raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit or sochain only.")
+    if not is_transaction_raw(transaction_raw=transaction_raw):
+        raise TransactionRawError("Invalid Bitcoin transaction raw.")
+
+    transaction_raw = clean_transaction_raw(transaction_raw)
+    decoded_transaction_raw = b64decode(transaction_raw.encode())
+    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+
+    if endpoint == "smartbit":
+        url = f"{config[loaded_transaction_raw['network']]['smartbit']}/pushtx"
+        data = dict(hex=loaded_transaction_raw["raw"])
+    else:
+        url = str(config[loaded_transaction_raw['network']]['sochain']).format(links="send_tx")
+        data = dict(tx_hex=loaded_transaction_raw["raw"])
+    return url, data, loaded_transaction_raw
 
 
 def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScript, P2shScript]:
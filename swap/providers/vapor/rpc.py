@@ -4,7 +4,6 @@ from typing import (
     Optional, Union
 )
 
-import requests
 import json
 
 from ...exceptions import (
@@ -13,7 +12,7 @@ from ...exceptions import (
 from ..config import vapor as config
 from .assets import AssetNamespace
 from .utils import (
-    is_network, is_address, amount_unit_converter, get_address_type
+    is_network, is_address, amount_unit_converter, get_address_type, _SESSION
 )
 
 
@@ -48,7 +47,7 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/address/{address}"
-    response = requests.get(
+    response = _SESSION.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.json() is None or response.json()["data"] is None:
@@ -99,7 +98,7 @@ def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
         script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
     ), sort=dict(by=by, order=order))
     params = dict(limit=limit)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -151,7 +150,7 @@ def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetN
         confirmations=confirmations
     )
     params = dict(address=address)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -191,7 +190,7 @@ def account_create(xpublic_key: str, label: str = "1st address", account_index:
 
     url = f"{config[network]['blockcenter']}/account/create"
     data = dict(pubkey=xpublic_key, label=label, account_index=account_index)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -230,7 +229,7 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
 
     url = f"{config[network]['blockcenter']}/merchant/build-advanced-tx"
     params = dict(address=address)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(transaction), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 300:
@@ -272,7 +271,7 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/tx/hash/{transaction_hash}"
-    response = requests.get(
+    response = _SESSION.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -306,7 +305,7 @@ def get_current_block_height(plus: int = 0, network: str = config["network"],
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/block"
-    response = requests.get(
+    response = _SESSION.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -364,7 +363,7 @@ def decode_raw(raw: str, network: str = config["network"],
 
     url = f"{config[network]['vapor-core']}/decode-raw-transaction"
     data = dict(raw_transaction=raw)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -407,7 +406,7 @@ def submit_raw(address: str, raw: str, signatures: list, network: str = config["
     url = f"{config[network]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=raw, signatures=signatures)
     params = dict(address=address)
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json: dict = response.json()
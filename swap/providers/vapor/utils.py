@@ -2,6 +2,7 @@
 
 from base64 import b64decode
 from pybytom.utils import is_address as btm_is_address
+from requests.adapters import HTTPAdapter
 from typing import Optional, Union
 
 import requests
@@ -16,6 +17,11 @@ from ...exceptions import (
 )
 from ..config import vapor as config
 
+# Shared HTTP session, keeps Vapor node/API connections alive between requests
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=4, max_retries=3))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=4, max_retries=3))
+
 
 def get_address_type(address: str) -> Optional[str]:
     """
@@ -201,7 +207,7 @@ def estimate_endblock(endtime: int, network: str = config["network"],
     endblock: float = (endtime - get_current_timestamp()) / config["to_create_new_block_seconds"]
 
     url = f"{config[network]['blockmeta']}/block"
-    response = requests.get(
+    response = _SESSION.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200:
@@ -238,7 +244,7 @@ def decode_transaction_raw(transaction_raw: str, headers: dict = config["headers
 
     url = f"{config[loaded_transaction_raw['network']]['vapor-core']}/decode-raw-transaction"
     data = dict(raw_transaction=loaded_transaction_raw["raw"])
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -286,7 +292,7 @@ def submit_transaction_raw(transaction_raw: str, headers: dict = config["headers
     url = f"{config[loaded_transaction_raw['network']]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"])
     params = dict(address=loaded_transaction_raw["address"])
-    response = requests.post(
+    response = _SESSION.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json = response.json()
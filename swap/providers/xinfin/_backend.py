@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+from ecdsa.curves import SECP256k1
+from hdwallet import HDWallet
+from hdwallet.hdwallet import (
+    BIP32KEY_HARDEN, CURVE_ORDER
+)
+from hdwallet.cryptocurrencies import Cryptocurrency
+from hdwallet.libs.ripemd160 import ripemd160
+from hdwallet.utils import get_semantic
+from functools import lru_cache
+from typing import (
+    Optional, Tuple
+)
+
+import hashlib
+import struct
+import hmac
+import ecdsa
+
+try:
+    import coincurve
+except ImportError:  # pragma: no cover
+    coincurve = None
+
+
+def public_key_from_secret(private_key: bytes) -> bytes:
+    """
+    Get SECP256k1 compressed public key from private key using libsecp256k1 (coincurve).
+
+    :param private_key: Private key bytes.
+    :type private_key: bytes
+
+    :returns: bytes -- Compressed public key.
+    """
+
+    return coincurve.PublicKey.from_secret(private_key).format(compressed=True)
+
+
+def derive_private_child(private_key: bytes, chain_code: bytes, index: int) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Derive BIP32 child private key and chain code.
+
+    :param private_key: Parent private key bytes.
+    :type private_key: bytes
+    :param chain_code: Parent chain code bytes.
+    :type chain_code: bytes
+    :param index: Child index, hardened indexes include ``0x80000000``.
+    :type index: int
+
+    :returns: tuple -- Child private key and chain code, ``None`` for invalid child.
+    """
+
+    if index & BIP32KEY_HARDEN:
+        data: bytes = b"\0" + private_key + struct.pack(">L", index)
+    else:
+        data: bytes = public_key_from_secret(private_key) + struct.pack(">L", index)
+
+    i: bytes = hmac.new(chain_code, data, hashlib.sha512).digest()
+    il, ir = int.from_bytes(i[:32], "big"), i[32:]
+    if il > CURVE_ORDER:
+        return None
+    secret: int = (il + int.from_bytes(private_key, "big")) % CURVE_ORDER
+    if secret == 0:
+        return None
+    return secret.to_bytes(32, "big"), ir
+
+
+def derive(hdwallet: HDWallet, path: str) -> HDWallet:
+    """
+    Drive HDWallet from path using libsecp256k1 (coincurve) when it's available.
+
+    Intermediate keys are derived on raw bytes and only the final child is loaded
+    into the HDWallet, falls back to the pure-Python HDWallet derivation otherwise.
+
+    :param hdwallet: HDWallet instance.
+    :type hdwallet: HDWallet
+    :param path: Derivation path.
+    :type path: str
+
+    :returns: HDWallet -- Hierarchical Deterministic Wallet instance.
+    """
+
+    if coincurve is None or hdwallet._key is None:
+        return hdwallet.from_path(path=path)
+
+    if str(path)[0:2] != "m/":
+        raise ValueError("Bad path, please insert like this type of path \"m/0'/0\"!, not: %r" % path)
+    if not hdwallet._root_private_key and not hdwallet._root_public_key:
+        raise ValueError("You can't drive this master key.")
+    if not hdwallet._chain_code:
+        raise ValueError("You can't drive xprivate_key and private_key.")
+
+    private_key, chain_code = hdwallet._key.to_string(), hdwallet._chain_code
+    depth, index, parent_fingerprint = hdwallet._depth, hdwallet._index, hdwallet._parent_fingerprint
+    for level in path.lstrip("m/").split("/"):
+        child_index: int = (int(level[:-1]) + BIP32KEY_HARDEN) if "'" in level else int(level)
+        child: Optional[Tuple[bytes, bytes]] = derive_private_child(
+            private_key=private_key, chain_code=chain_code, index=child_index
+        )
+        if child is not None:
+            parent_fingerprint = ripemd160(hashlib.sha256(public_key_from_secret(private_key)).digest())[:4]
+            (private_key, chain_code), depth, index = child, (depth + 1), child_index
+        hdwallet._path += str("/" + level)
+
+    hdwallet._private_key, hdwallet._chain_code, hdwallet._depth, hdwallet._index, hdwallet._parent_fingerprint = (
+        private_key, chain_code, depth, index, parent_fingerprint
+    )
+    hdwallet._key = ecdsa.SigningKey.from_string(private_key, curve=SECP256k1)
+    hdwallet._verified_key = hdwallet._key.get_verifying_key()
+    return hdwallet
+
+
+@lru_cache(maxsize=32)
+def xprivate_key_semantic(cryptocurrency: Cryptocurrency, version: bytes) -> Optional[str]:
+    """
+    Get extended private key semantic (p2pkh, p2wpkh, ...) from its version bytes.
+
+    :param cryptocurrency: HDWallet cryptocurrency class.
+    :type cryptocurrency: Cryptocurrency
+    :param version: Extended private key version bytes.
+    :type version: bytes
+
+    :returns: str -- Semantic, ``None`` for unknown version.
+    """
+
+    return get_semantic(_cryptocurrency=cryptocurrency, version=version, key_type="private_key")
+
+
+def load_xprivate_key(hdwallet: HDWallet, xprivate_key: bytes, strict: bool = True) -> HDWallet:
+    """
+    Master HDWallet from Base58Check decoded xprivate key payload.
+
+    Same as ``HDWallet.from_xprivate_key`` without the Base58 decode and checksum.
+
+    :param hdwallet: HDWallet instance.
+    :type hdwallet: HDWallet
+    :param xprivate_key: Decoded 78 bytes xprivate key.
+    :type xprivate_key: bytes
+    :param strict: Strict for must be root xprivate key, default to ``True``.
+    :type strict: bool
+
+    :returns: HDWallet -- Hierarchical Deterministic Wallet instance.
+    """
+
+    if len(xprivate_key) != 78:
+        raise ValueError("Invalid xprivate key.")
+
+    version, chain_code, private_key = xprivate_key[:4], xprivate_key[13:45], xprivate_key[46:]
+    semantic: Optional[str] = xprivate_key_semantic(hdwallet._cryptocurrency, version)
+    if strict and (semantic is None or xprivate_key[4:13] != bytes(9)):
+        raise ValueError("Invalid root xprivate key.")
+
+    depth, parent_fingerprint, index = (
+        xprivate_key[4], xprivate_key[5:9], struct.unpack(">L", xprivate_key[9:13])[0]
+    )
+    hdwallet._root_depth, hdwallet._root_parent_fingerprint, hdwallet._root_index = (
+        depth, parent_fingerprint, index
+    )
+    hdwallet._depth, hdwallet._parent_fingerprint, hdwallet._index = (
+        depth, parent_fingerprint, index
+    )
+    hdwallet._i = private_key + chain_code
+    hdwallet._root_private_key = (private_key, chain_code)
+    hdwallet._private_key, hdwallet._chain_code = private_key, chain_code
+    hdwallet._key = ecdsa.SigningKey.from_string(private_key, curve=SECP256k1)
+    hdwallet._verified_key = hdwallet._key.get_verifying_key()
+    if hdwallet._use_default_path:
+        hdwallet.from_path(path=hdwallet._cryptocurrency.DEFAULT_PATH)
+    if hdwallet._from_class:
+        hdwallet.from_path(path=hdwallet._path_class)
+    hdwallet._public_key = hdwallet.compressed()
+    hdwallet._semantic = semantic
+    return hdwallet
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 from web3 import Web3
-from web3.types import Wei
+from web3.types import (
+    Wei, RPCResponse
+)
 from web3.providers import (
     HTTPProvider, WebsocketProvider
 )
@@ -9,9 +11,10 @@ from web3.contract import Contract
 from web3._utils.threads import Timeout
 from pyxdc.utils import decode_transaction_raw as dtr
 from hexbytes.main import HexBytes
+from requests.adapters import HTTPAdapter
 from eth_typing import URI
 from typing import (
-    Optional, Tuple
+    Optional, Tuple, List
 )
 
 import web3 as _web3
@@ -20,6 +23,11 @@ import json
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from ...exceptions import (
     AddressError, NetworkError, APIError
 )
@@ -28,6 +36,30 @@ from .utils import (
     is_network, is_address, to_checksum_address
 )
 
+# Shared HTTP session, keeps XinFin node connections alive between Web3 and JSON-RPC requests
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
+def _loads(data: bytes) -> dict:
+    # JSON-RPC quantities are hex strings, so orjson's 64-bit integer limit doesn't apply here
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+class _HTTPProvider(HTTPProvider):
+    """
+    XinFin HTTP provider, decodes JSON-RPC responses with orjson when it's installed.
+    """
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return _loads(raw_response)
+
 
 def get_web3(network: str = config["network"], provider: str = config["provider"]) -> Web3:
     """
@@ -51,11 +83,12 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
                            "choose only 'mainnet', 'apothem' or 'testnet' networks.")
 
     if provider == "http":
-        web3: Web3 = Web3(HTTPProvider(
+        web3: Web3 = Web3(_HTTPProvider(
                 endpoint_uri=URI(config[network]["http"]),
                 request_kwargs={
                     "timeout": config["timeout"]
-                }
+                },
+                session=_SESSION
             )
         )
         return web3
@@ -246,11 +279,11 @@ def get_transaction_receipt(transaction_hash: str, network: str = config["networ
         data = dict(
             jsonrpc="2.0", method="eth_getTransactionReceipt", params=[transaction_hash], id=1
         )
-        response = requests.post(
+        response = _SESSION.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         if response.status_code == 200:
-            return response.json()["result"]
+            return _loads(response.content)["result"]
         raise APIError(response.status_code, response.content)
     else:
         web3: Web3 = get_web3(network=network, provider=provider)
@@ -300,6 +333,109 @@ def wait_for_transaction_receipt(transaction_hash: str, network: str = config["n
     return txn_receipt
 
 
+def get_transaction_parameters(address: str, transaction_hash: Optional[str] = None, network: str = config["network"],
+                               provider: str = config["provider"], headers: dict = config["headers"],
+                               timeout: int = config["timeout"]) -> Tuple[int, Wei, Optional[dict]]:
+    """
+    Get XinFin transaction nonce, gas price and optional transaction receipt.
+
+    On the http provider all of them are fetched with a single JSON-RPC batch request.
+
+    :param address: XinFin sender address.
+    :type address: str
+    :param transaction_hash: XinFin transaction hash/id to get receipt, defaults to ``None``.
+    :type transaction_hash: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: XinFin network provider, defaults to ``http``.
+    :type provider: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: tuple -- XinFin nonce, gas price (Wei) and transaction receipt.
+
+    >>> from swap.providers.xinfin.rpc import get_transaction_parameters
+    >>> get_transaction_parameters(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", network="testnet")
+    (2, 20000000000, None)
+    """
+
+    # Check parameter instances
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+    if not is_address(address=address):
+        raise AddressError(f"Invalid XinFin '{address}' address.")
+
+    checksum_address: str = to_checksum_address(address=address, prefix="0x")
+    if provider != "http":
+        web3: Web3 = get_web3(network=network, provider=provider)
+        return (
+            web3.eth.get_transaction_count(checksum_address), web3.eth.gas_price,
+            get_transaction_receipt(
+                transaction_hash=transaction_hash, network=network, provider=provider, headers=headers, timeout=timeout
+            ) if transaction_hash else None
+        )
+
+    calls: List[Tuple[str, list]] = [
+        ("eth_getTransactionCount", [checksum_address, "latest"]), ("eth_gasPrice", [])
+    ]
+    if transaction_hash:
+        calls.append(("eth_getTransactionReceipt", [transaction_hash]))
+    results: list = batch_request(calls=calls, network=network, headers=headers, timeout=timeout)
+    return int(results[0], 16), Wei(int(results[1], 16)), (results[2] if transaction_hash else None)
+
+
+def batch_request(calls: List[Tuple[str, list]], network: str = config["network"],
+                  headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
+    """
+    Send many XinFin JSON-RPC calls in a single http batch request.
+
+    :param calls: XinFin JSON-RPC method and params pairs.
+    :type calls: list
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: list -- XinFin JSON-RPC results, in the same order of calls.
+
+    >>> from swap.providers.xinfin.rpc import batch_request
+    >>> batch_request(calls=[("eth_chainId", []), ("eth_gasPrice", [])], network="testnet")
+    ['0x33', '0x2540be400']
+    """
+
+    # Check parameter instances
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+    data: list = [
+        dict(jsonrpc="2.0", method=method, params=params, id=index)
+        for index, (method, params) in enumerate(calls)
+    ]
+    response = _SESSION.post(
+        url=config[network]["http"], data=json.dumps(data), headers=headers, timeout=timeout
+    )
+    if response.status_code != 200:
+        raise APIError(response.status_code, response.content)
+    responses = _loads(response.content)
+    if not isinstance(responses, list):
+        # Nodes reject a whole batch with a single (error) response object
+        error: dict = (responses.get("error") or {}) if isinstance(responses, dict) else {}
+        raise APIError(error.get("message", "Invalid XinFin JSON-RPC batch response."), error.get("code"))
+    # Batch responses may come back in any order, match them by id
+    results: list = [None] * len(calls)
+    for result in responses:
+        if "error" in result:
+            raise APIError(result["error"].get("message"), result["error"].get("code"))
+        results[result["id"]] = result["result"]
+    return results
+
+
 def decode_raw(raw: str) -> dict:
     """
     Decode original XinFin raw into blockchain.
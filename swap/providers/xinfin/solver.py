@@ -1,12 +1,102 @@
 #!/usr/bin/env python3
 
-from typing import Optional
+from hdwallet.libs.base58 import check_decode
+from typing import (
+    Optional, List, TYPE_CHECKING
+)
 
 from ..config import xinfin as config
-from .wallet import Wallet
 
+if TYPE_CHECKING:
+    from .wallet import Wallet
 
-class NormalSolver:
+__all__: list = [
+    "NormalSolver", "FundSolver", "WithdrawSolver", "RefundSolver"
+]
+
+# XinFin BIP44 derivation path printf-style template
+_PATH_FMT: str = config["bip44_path"].replace(
+    "{account}", "%d"
+).replace(
+    "{change}", "%d"
+).replace(
+    "{address}", "%d"
+)
+
+
+def _bip44_path(account: int, change: bool, address: int) -> str:
+    return _PATH_FMT % (account, (1 if change else 0), address)
+
+
+def _derive(xprivate_key: bytes, path: str, network: str) -> "Wallet":
+    # A fresh wallet on every solve, callers may keep deriving (from_index, ...) the returned one.
+    # Imported here, so importing solvers doesn't load the web3 wallet stack
+    from .wallet import Wallet
+
+    return Wallet(network=network).from_xprivate_key_bytes(
+        xprivate_key=xprivate_key
+    ).from_path(
+        path=path
+    )
+
+
+class _XinfinSolver:
+    """
+    XinFin base solver, shared by the Normal, Fund, Withdraw and Refund solvers.
+    """
+
+    __slots__ = ("_xprivate_key", "_xprivate_key_bytes", "_strict", "_path")
+
+    def __init__(self, xprivate_key: str, account: int = 0, change: bool = False, address: int = 0,
+                 path: Optional[str] = None, strict: bool = True):
+
+        self._xprivate_key: str = xprivate_key
+        # Base58Check decoded on the first solve and kept, instead of on every solve
+        self._xprivate_key_bytes: Optional[bytes] = None
+        self._strict: bool = strict
+        self._path: str = path if path is not None else _bip44_path(
+            account=account, change=change, address=address
+        )
+
+    def solve(self, network: str = config["network"]) -> "Wallet":
+
+        if self._xprivate_key_bytes is None:
+            self._xprivate_key_bytes = check_decode(self._xprivate_key)
+        return _derive(
+            xprivate_key=self._xprivate_key_bytes, path=self._path, network=network
+        )
+
+    @classmethod
+    def solve_many(cls, xprivate_key: str, paths: List[str],
+                   network: str = config["network"]) -> List["Wallet"]:
+        """
+        Solve many derivation paths of one XinFin xprivate key.
+
+        The xprivate key is Base58Check decoded once for all paths, every path is
+        derived from the root xprivate key.
+
+        :param xprivate_key: XinFin xprivate key.
+        :type xprivate_key: str
+        :param paths: XinFin derivation paths.
+        :type paths: list
+        :param network: XinFin network, defaults to ``mainnet``.
+        :type network: str
+
+        :returns: list -- XinFin wallet instances, in paths order.
+
+        >>> from swap.providers.xinfin.solver import RefundSolver
+        >>> sender_root_xprivate_key: str = "xprv9s21ZrQH143K3XihXQBN8Uar2WBtrjSzK2oRDEGQ25pA2kKAADoQXaiiVXht163ZTrdtTXfM4GqNRE9gWQHky25BpvBQuuhNCM3SKwWTPNJ"
+        >>> RefundSolver.solve_many(xprivate_key=sender_root_xprivate_key, paths=["m/44'/550'/0'/0/0", "m/44'/550'/0'/0/1"])
+        [<swap.providers.xinfin.wallet.Wallet object at 0x040DA268>, <swap.providers.xinfin.wallet.Wallet object at 0x040DA2E0>]
+        """
+
+        xprivate_key_bytes: bytes = check_decode(xprivate_key)
+        return [
+            _derive(xprivate_key=xprivate_key_bytes, path=path, network=network) for path in paths
+        ]
+
+
+class NormalSolver(_XinfinSolver):
     """
     XinFin Normal solver.
 
@@ -31,30 +121,10 @@ class NormalSolver:
     <swap.providers.xinfin.solver.FundSolver object at 0x03FCCA60>
     """
 
-    def __init__(self, xprivate_key: str, account: int = 0, change: bool = False, address: int = 0,
-                 path: Optional[str] = None, strict: bool = True):
-        self._xprivate_key: str = xprivate_key
-        self._strict: bool = strict
-        self._path: Optional[str] = path
-
-        self._account: int = account
-        self._change: bool = change
-        self._address: int = address
-
-    def solve(self, network: str = config["network"]) -> Wallet:
-        if self._path is None:
-            self._path = config["bip44_path"].format(
-                account=self._account, change=(1 if self._change else 0), address=self._address
-            )
-
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
+    __slots__ = ()
 
 
-class FundSolver:
+class FundSolver(_XinfinSolver):
     """
     XinFin Fund solver.
 
@@ -79,32 +149,10 @@ class FundSolver:
     <swap.providers.xinfin.solver.FundSolver object at 0x03FCCA60>
     """
 
-    def __init__(self, xprivate_key: str, account: int = 0, change: bool = False, address: int = 0,
-                 path: Optional[str] = None, strict: bool = True):
-
-        self._xprivate_key: str = xprivate_key
-        self._strict: bool = strict
-        self._path: Optional[str] = path
-
-        self._account: int = account
-        self._change: bool = change
-        self._address: int = address
+    __slots__ = ()
 
-    def solve(self, network: str = config["network"]) -> Wallet:
 
-        if self._path is None:
-            self._path = config["bip44_path"].format(
-                account=self._account, change=(1 if self._change else 0), address=self._address
-            )
-
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
-
-
-class WithdrawSolver:
+class WithdrawSolver(_XinfinSolver):
     """
     XinFin Withdraw solver.
 
@@ -129,32 +177,10 @@ class WithdrawSolver:
     <swap.providers.xinfin.solver.WithdrawSolver object at 0x03FCCA60>
     """
 
-    def __init__(self, xprivate_key: str, account: int = 0, change: bool = False, address: int = 0,
-                 path: Optional[str] = None, strict: bool = True):
+    __slots__ = ()
 
-        self._xprivate_key: str = xprivate_key
-        self._strict: bool = strict
-        self._path: Optional[str] = path
 
-        self._account: int = account
-        self._change: bool = change
-        self._address: int = address
-
-    def solve(self, network: str = config["network"]) -> Wallet:
-
-        if self._path is None:
-            self._path = config["bip44_path"].format(
-                account=self._account, change=(1 if self._change else 0), address=self._address
-            )
-
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
-
-
-class RefundSolver:
+class RefundSolver(_XinfinSolver):
     """
     XinFin Refund solver.
 
@@ -179,24 +205,4 @@ class RefundSolver:
     <swap.providers.xinfin.solver.RefundSolver object at 0x03FCCA60>
     """
 
-    def __init__(self, xprivate_key: str, account: int = 0, change: bool = False, address: int = 0,
-                 path: Optional[str] = None, strict: bool = True):
-
-        self._xprivate_key: str = xprivate_key
-        self._strict: bool = strict
-        self._path: Optional[str] = path
-
-        self._account: int = account
-        self._change: bool = change
-        self._address: int = address
-
-    def solve(self, network: str = config["network"]) -> Wallet:
-
-        if self._path is None:
-            self._path = config["bip44_path"].format(
-                account=self._account, change=(1 if self._change else 0), address=self._address
-            )
-
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(path=self._path)
+    __slots__ = ()
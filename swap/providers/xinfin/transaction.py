@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 
 from binascii import unhexlify
+from eth_account import Account
 from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
 from web3.datastructures import AttributeDict
-from web3.contract import Contract
+from web3.contract import (
+    Contract, ContractFunction
+)
+from web3.eth import Eth
 from web3 import Web3
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List, Callable, Tuple
 )
+from functools import partial
 from base64 import b64encode
 
+import asyncio
 import json
 import sys
 import os
@@ -23,7 +30,7 @@ from ..config import xinfin as config
 from .wallet import Wallet
 from .htlc import HTLC
 from .rpc import (
-    get_web3, get_transaction_receipt
+    get_web3, get_transaction_parameters, batch_request
 )
 from .utils import (
     _AttributeDict, is_network, is_address, to_checksum_address, amount_unit_converter
@@ -32,6 +39,33 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 
+# Zero XinFin transaction value
+_WEI_ZERO: Wei = Wei(0)
+# XinFin fee converters from Wei, same results as amount_unit_converter
+_FEE_CONVERTERS: dict = {
+    "Wei": lambda fee: fee,
+    "Gwei": lambda fee: int((fee * config["units"]["Gwei"]) / config["units"]["Wei"]),
+    "XDC": lambda fee: float((fee * config["units"]["XDC"]) / config["units"]["Wei"])
+}
+# XinFin built contract transaction keys order, as web3 builds them with an explicit gas
+_TRANSACTION_KEYS: tuple = ("chainId", "from", "value", "nonce", "gas", "gasPrice", "to", "data")
+# Typical XinFin HTLC gas limits, to build without gas estimation
+FUND_GAS: int = 150_000
+WITHDRAW_GAS: int = 90_000
+REFUND_GAS: int = 70_000
+# Typical XinFin XRC20 HTLC gas limits, to build without gas estimation
+XRC20_FUND_GAS: int = 210_000
+XRC20_WITHDRAW_GAS: int = 120_000
+XRC20_REFUND_GAS: int = 80_000
+
+
+def _ordered_transaction(transaction: dict) -> dict:
+    # Estimated gas is merged first by web3, keep the transaction raw bytes stable
+    return dict(
+        [(key, transaction[key]) for key in _TRANSACTION_KEYS if key in transaction] +
+        [(key, value) for key, value in transaction.items() if key not in _TRANSACTION_KEYS]
+    )
+
 
 class Transaction:
     """
@@ -56,17 +90,237 @@ class Transaction:
         if not is_network(network=network):
             raise NetworkError(f"Invalid XinFin '{network}' network",
                                "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+        if provider not in ["http", "websocket"]:
+            raise ValueError(f"Invalid XinFin '{provider}' provider",
+                             "choose only 'http' or 'websocket' providers.")
 
         self._xrc20: bool = xrc20
         self._network: str = network
-        self.web3: Web3 = get_web3(
-            network=network, provider=provider
-        )
+        self._provider: str = provider
+        self._web3: Optional[Web3] = None
+        # Shared by all Web3 instances, doesn't need the provider
+        self._account: Account = Eth.account
 
         self._transaction: Optional[dict] = None
         self._signature: Optional[dict] = None
         self._type: Optional[str] = None
         self._fee: Optional[Wei] = None
+        # Prefetched by build_many, nonce, gas price, receipt and chain id of the next build
+        self._parameters: Optional[Tuple[int, Wei, Optional[dict]]] = None
+        self._chain_id: Optional[int] = None
+
+    @property
+    def web3(self) -> Web3:
+        """
+        Get XinFin Web3 instance, initialized on first use.
+
+        :returns: Web3 -- XinFin Web3 instance.
+
+        >>> from swap.providers.xinfin.transaction import Transaction
+        >>> transaction: Transaction = Transaction(network="testnet")
+        >>> transaction.web3
+        <web3.main.Web3 object at 0x000001DDECCD0640>
+        """
+
+        if self._web3 is None:
+            self._web3 = get_web3(
+                network=self._network, provider=self._provider
+            )
+        return self._web3
+
+    @web3.setter
+    def web3(self, web3: Web3) -> None:
+        self._web3 = web3
+
+    async def build_transaction_async(self, *args, **kwargs) -> "Transaction":
+        """
+        Build XinFin transaction without blocking the event loop.
+
+        Takes the same arguments as ``build_transaction``, which runs in the loop's default
+        executor, so many builds can overlap their RPC round-trips with ``asyncio.gather``.
+
+        :returns: Transaction -- XinFin transaction instance.
+
+        >>> import asyncio
+        >>> from swap.providers.xinfin.transaction import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="testnet")
+        >>> asyncio.get_event_loop().run_until_complete(refund_transaction.build_transaction_async(transaction_hash="0xe49bb94bb00e3e4e7e4b4e5b4d4b8e4b2a4f8c1ba2e1e9c2b3e3f1c4d5e6f7a8", address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232"))
+        <swap.providers.xinfin.transaction.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await asyncio.get_event_loop().run_in_executor(
+            None, partial(self.build_transaction, *args, **kwargs)
+        )
+
+    def _get_transaction_parameters(self, address: str,
+                                    transaction_hash: Optional[str] = None) -> Tuple[int, Wei, Optional[dict]]:
+        if self._parameters is not None:
+            parameters, self._parameters = self._parameters, None
+            return parameters
+        return get_transaction_parameters(
+            address=address, transaction_hash=transaction_hash, network=self._network, provider=self._provider
+        )
+
+    def _build_contract_transaction(self, function: ContractFunction, address: str, value: Wei, nonce: int,
+                                    gas_price: Wei, gas: Optional[int], operation: str) -> "Transaction":
+        transaction: dict = {
+            "from": address,
+            "value": value,
+            "nonce": nonce,
+            "gasPrice": gas_price
+        }
+        if gas is not None:
+            transaction["gas"] = gas
+        if self._chain_id is not None:
+            transaction["chainId"] = self._chain_id
+        # Gas is estimated once by buildTransaction on the encoded call data, unless it's given
+        self._transaction = _ordered_transaction(function.buildTransaction(transaction))
+        self._fee = self._transaction["gas"]
+        self._type = f"xinfin_xrc20_{operation}_unsigned" if self._xrc20 else f"xinfin_{operation}_unsigned"
+        return self
+
+    @classmethod
+    def build_many(cls, specs: List[dict], network: str = config["network"], xrc20: bool = False,
+                   provider: str = config["provider"]) -> List["Transaction"]:
+        """
+        Build many XinFin fund, withdraw or refund transactions together.
+
+        On the http provider, the chain id, gas price, sender nonces and funded transaction receipts of
+        all transactions are fetched in one JSON-RPC batch request, and their gas in one more. Transactions
+        of the same sender get consecutive nonces.
+
+        :param specs: XinFin ``build_transaction`` arguments of each transaction.
+        :type specs: list
+        :param network: XinFin network, defaults to ``mainnet``.
+        :type network: str
+        :param xrc20: Transaction XRC20 token, default to ``False``.
+        :type xrc20: bool
+        :param provider: XinFin network provider, defaults to ``http``.
+        :type provider: str
+
+        :returns: list -- XinFin built transaction instances.
+
+        >>> from swap.providers.xinfin.transaction import RefundTransaction
+        >>> RefundTransaction.build_many(specs=[{"transaction_hash": "0xe49bb94bb00e3e4e7e4b4e5b4d4b8e4b2a4f8c1ba2e1e9c2b3e3f1c4d5e6f7a8", "address": "xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232"}], network="testnet")
+        [<swap.providers.xinfin.transaction.RefundTransaction object at 0x0409DAF0>]
+        """
+
+        # Check parameter instances
+        if cls not in (FundTransaction, WithdrawTransaction, RefundTransaction):
+            raise TypeError(f"Can't build many XinFin {cls.__name__}, only fund, withdraw or refund transactions.")
+        for spec in specs:
+            if not is_address(address=spec["address"]):
+                raise AddressError(f"Invalid XinFin sender '{spec['address']}' address.")
+
+        web3: Web3 = get_web3(network=network, provider=provider)
+        transactions: List[Transaction] = [
+            cls(network=network, xrc20=xrc20, provider=provider) for _ in specs
+        ]
+        for transaction in transactions:
+            transaction.web3 = web3
+        if provider != "http":
+            return [
+                transaction.build_transaction(**spec) for transaction, spec in zip(transactions, specs)
+            ]
+
+        addresses: List[str] = list(dict.fromkeys(
+            to_checksum_address(address=spec["address"], prefix="0x") for spec in specs
+        ))
+        transaction_hashes: List[str] = list(dict.fromkeys(
+            spec["transaction_hash"] for spec in specs if spec.get("transaction_hash")
+        ))
+        results: list = batch_request(calls=(
+            [("eth_chainId", []), ("eth_gasPrice", [])] +
+            [("eth_getTransactionCount", [address, "latest"]) for address in addresses] +
+            [("eth_getTransactionReceipt", [transaction_hash]) for transaction_hash in transaction_hashes]
+        ), network=network)
+        chain_id, gas_price = int(results[0], 16), Wei(int(results[1], 16))
+        nonces: dict = {
+            address: int(nonce, 16) for address, nonce in zip(addresses, results[2:2 + len(addresses)])
+        }
+        receipts: dict = dict(zip(transaction_hashes, results[2 + len(addresses):]))
+
+        estimates: List[Transaction] = []
+        for transaction, spec in zip(transactions, specs):
+            address: str = to_checksum_address(address=spec["address"], prefix="0x")
+            transaction._chain_id = chain_id
+            transaction._parameters = (nonces[address], gas_price, receipts.get(spec.get("transaction_hash")))
+            nonces[address] += 1
+            if spec.get("gas") is None:
+                # Placeholder gas skips estimation in buildTransaction, all are estimated below
+                transaction.build_transaction(**dict(spec, gas=0))
+                estimates.append(transaction)
+            else:
+                transaction.build_transaction(**spec)
+
+        if estimates:
+            gases: list = batch_request(calls=[
+                ("eth_estimateGas", [{
+                    key: (hex(value) if isinstance(value, int) else value)
+                    for key, value in transaction._transaction.items() if key not in ["gas", "chainId"]
+                }]) for transaction in estimates
+            ], network=network)
+            for transaction, gas in zip(estimates, gases):
+                transaction._fee = transaction._transaction["gas"] = int(gas, 16)
+        return transactions
+
+    @classmethod
+    def bulk_sign(cls, transactions: List["Transaction"], solver: Union[
+        NormalSolver, FundSolver, WithdrawSolver, RefundSolver
+    ]) -> List["Transaction"]:
+        """
+        Sign many built XinFin transactions with one solver.
+
+        The solver wallet is solved and its local account is loaded only once for all transactions.
+
+        :param transactions: XinFin built transactions.
+        :type transactions: list
+        :param solver: XinFin solver of the transactions sender.
+        :type solver: xinfin.solver.NormalSolver, xinfin.solver.FundSolver, xinfin.solver.WithdrawSolver, xinfin.solver.RefundSolver
+
+        :returns: list -- XinFin signed transaction instances.
+
+        >>> from swap.providers.xinfin.transaction import Transaction, RefundTransaction
+        >>> from swap.providers.xinfin.solver import RefundSolver
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="testnet")
+        >>> refund_transaction.build_transaction(transaction_hash="0xe49bb94bb00e3e4e7e4b4e5b4d4b8e4b2a4f8c1ba2e1e9c2b3e3f1c4d5e6f7a8", address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232")
+        >>> refund_solver: RefundSolver = RefundSolver(xprivate_key="xprv9s21ZrQH143K3Y3pdbkbjreZQ9RVmqTLhRgf86uZyCJk2ou36YdUJt5frjwihGWmV1fQEDioiGZXWXUbHLy3kQf5xmhvhp8dZ2tfn6tgGUj", path="m/44'/550'/0'/0/0")
+        >>> Transaction.bulk_sign(transactions=[refund_transaction], solver=refund_solver)
+        [<swap.providers.xinfin.transaction.RefundTransaction object at 0x0409DAF0>]
+        """
+
+        # Check parameter instances
+        for transaction in transactions:
+            if not isinstance(transaction, cls):
+                raise TypeError(f"Transaction must be XinFin {cls.__name__}, not {type(transaction).__name__} type.")
+            # Same solver check as the transaction's own sign
+            solver_class: Optional[type] = next((
+                solver_class for transaction_class, solver_class in _SOLVERS.items()
+                if isinstance(transaction, transaction_class)
+            ), None)
+            if solver_class is None:
+                raise TypeError(f"Transaction must be XinFin Normal, Fund, Withdraw or Refund transaction, "
+                                f"not {type(transaction).__name__} type.")
+            if not isinstance(solver, solver_class):
+                raise TypeError(f"Solver must be XinFin {solver_class.__name__}, not {type(solver).__name__} type.")
+            if transaction._transaction is None:
+                raise ValueError("Transaction is none, build transaction first.")
+
+        wallet: Wallet = solver.solve()
+        account: LocalAccount = Account.from_key(wallet.private_key())
+        for transaction in transactions:
+            signed_transaction: SignedTransaction = account.sign_transaction(
+                transaction_dict=transaction._transaction
+            )
+            transaction._signature = {
+                "hash": signed_transaction["hash"].hex(),
+                "rawTransaction": signed_transaction["rawTransaction"].hex(),
+                "r": signed_transaction["r"],
+                "s": signed_transaction["s"],
+                "v": signed_transaction["v"]
+            }
+            transaction._type = transaction._type.replace("_unsigned", "_signed")
+        return transactions
 
     def fee(self, unit: str = config["unit"]) -> Union[Wei, int, float]:
         """
@@ -89,13 +343,13 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
-        if unit not in ["XDC", "Gwei", "Wei"]:
+        converter: Optional[Callable[[Wei], Union[Wei, int, float]]] = _FEE_CONVERTERS.get(unit)
+        if converter is None:
             raise UnitError(f"Invalid XinFin '{unit}' unit", "choose only 'XDC', 'Gwei' or 'Wei' units.")
-        return self._fee if unit == "Wei" else \
-            amount_unit_converter(amount=self._fee, unit_from=f"Wei2{unit}")
+        return converter(self._fee)
 
     def hash(self) -> Optional[str]:
         """
@@ -114,7 +368,7 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
         return self._signature["hash"] if self._signature else None
@@ -137,7 +391,7 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
         return self._transaction
@@ -159,7 +413,7 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
         return self._signature["rawTransaction"] if self._signature else None
@@ -179,7 +433,7 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
         return self._type
@@ -201,7 +455,7 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
         return self._signature
@@ -224,17 +478,17 @@ class Transaction:
         """
 
         # Check transaction
-        if not self._transaction:
+        if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
-            fee=self._fee,
-            type=self._type,
-            transaction=self._transaction,
-            signature=self._signature,
-            network=self._network,
-            xrc20=self._xrc20
-        ))).encode()).decode())
+        return clean_transaction_raw(b64encode(json.dumps({
+            "fee": self._fee,
+            "type": self._type,
+            "transaction": self._transaction,
+            "signature": self._signature,
+            "network": self._network,
+            "xrc20": self._xrc20
+        }).encode()).decode())
 
 
 class NormalTransaction(Transaction):
@@ -291,10 +545,15 @@ class NormalTransaction(Transaction):
         # Set address, fee and confirmations
         recipient_address, amount = list(recipient.items())[0]
         self._address, self._token_address, self._amount = (
-            address, token_address, Wei(
+            address, token_address, (
                 amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
             ) if not self._xrc20 else amount
         )
+        checksum_address: str = to_checksum_address(address=address, prefix="0x")
+        # Get nonce and gas price in one request
+        nonce, gas_price, _ = get_transaction_parameters(
+            address=address, network=self._network, provider=self._provider
+        )
 
         if self._xrc20:
             # Get current working directory path (like linux or unix path).
@@ -309,33 +568,21 @@ class NormalTransaction(Transaction):
             transfer_function = xrc20_contract.functions.transfer(
                 to_checksum_address(address=recipient_address, prefix="0x"), self._amount
             )
-            self._fee = transfer_function.estimateGas({
-                "from": to_checksum_address(address=address, prefix="0x"),
-                "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gasPrice": self.web3.eth.gas_price
-            })
-
-            self._transaction = transfer_function.buildTransaction({
-                "from": to_checksum_address(address=address, prefix="0x"),
-                "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gas": self._fee,
-                "gasPrice": self.web3.eth.gas_price
-            })
+            # Gas is estimated once by buildTransaction, on the encoded call data
+            self._transaction = _ordered_transaction(transfer_function.buildTransaction({
+                "from": checksum_address,
+                "value": _WEI_ZERO,
+                "nonce": nonce,
+                "gasPrice": gas_price
+            }))
+            self._fee = self._transaction["gas"]
         else:
             self._transaction = {
-                "from": to_checksum_address(address=address, prefix="0x"),
+                "from": checksum_address,
                 "to": to_checksum_address(address=recipient_address, prefix="0x"),
                 "value": self._amount,
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gasPrice": self.web3.eth.gas_price
+                "nonce": nonce,
+                "gasPrice": gas_price
             }
             self._fee = self.web3.eth.estimateGas(self._transaction)
             self._transaction.setdefault("gas", self._fee)
@@ -366,18 +613,18 @@ class NormalTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin NormalSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+        signed_normal_transaction: SignedTransaction = self._account.sign_transaction(
             transaction_dict=self._transaction,
             private_key=wallet.private_key()
         )
 
-        self._signature = dict(
-            hash=signed_normal_transaction["hash"].hex(),
-            rawTransaction=signed_normal_transaction["rawTransaction"].hex(),
-            r=signed_normal_transaction["r"],
-            s=signed_normal_transaction["s"],
-            v=signed_normal_transaction["v"]
-        )
+        self._signature = {
+            "hash": signed_normal_transaction["hash"].hex(),
+            "rawTransaction": signed_normal_transaction["rawTransaction"].hex(),
+            "r": signed_normal_transaction["r"],
+            "s": signed_normal_transaction["s"],
+            "v": signed_normal_transaction["v"]
+        }
         self._type = "xinfin_xrc20_normal_signed" if self._xrc20 else "xinfin_normal_signed"
         return self
 
@@ -405,7 +652,7 @@ class FundTransaction(Transaction):
         )
 
     def build_transaction(self, address: str, htlc: HTLC, amount: Union[Wei, int, float],
-                          unit: str = config["unit"]) -> "FundTransaction":
+                          unit: str = config["unit"], gas: Optional[int] = None) -> "FundTransaction":
         """
         Build XinFin fund transaction.
 
@@ -417,6 +664,8 @@ class FundTransaction(Transaction):
         :type amount: Wei, int, float
         :param unit: XinFin unit, default to ``Wei``.
         :type unit: str
+        :param gas: XinFin gas limit to skip gas estimation (like ``FUND_GAS``), defaults to ``None``.
+        :type gas: int
 
         :returns: FundTransaction -- XinFin fund transaction instance.
 
@@ -441,9 +690,12 @@ class FundTransaction(Transaction):
         if unit not in ["XDC", "Gwei", "Wei"]:
             raise UnitError("Invalid XinFin unit, choose only 'XDC', 'Gwei' or 'Wei' units.")
 
-        _amount: Wei = Wei(
+        _amount: Wei = (
             amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
         ) if not self._xrc20 else amount
+        checksum_address: str = to_checksum_address(address=address, prefix="0x")
+        # Get nonce and gas price in one request
+        nonce, gas_price, _ = self._get_transaction_parameters(address=address)
 
         htlc_contract: Contract = self.web3.eth.contract(
             address=htlc.contract_address(prefix="0x"), abi=htlc.abi()
@@ -466,26 +718,10 @@ class FundTransaction(Transaction):
                 htlc.agreements["endtime"]["timestamp"]  # Locktime Seconds
             )
 
-        self._fee = htlc_fund_function.estimateGas({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": _amount if not self._xrc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
-        })
-
-        self._transaction = htlc_fund_function.buildTransaction({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": _amount if not self._xrc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
-        })
-        self._type = "xinfin_xrc20_fund_unsigned" if self._xrc20 else "xinfin_fund_unsigned"
-        return self
+        return self._build_contract_transaction(
+            function=htlc_fund_function, address=checksum_address, value=_amount if not self._xrc20 else _WEI_ZERO,
+            nonce=nonce, gas_price=gas_price, gas=gas, operation="fund"
+        )
 
     def sign(self, solver: FundSolver) -> "FundTransaction":
         """
@@ -514,18 +750,18 @@ class FundTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin FundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+        signed_fund_transaction: SignedTransaction = self._account.sign_transaction(
             transaction_dict=self._transaction,
             private_key=wallet.private_key()
         )
 
-        self._signature = dict(
-            hash=signed_fund_transaction["hash"].hex(),
-            rawTransaction=signed_fund_transaction["rawTransaction"].hex(),
-            r=signed_fund_transaction["r"],
-            s=signed_fund_transaction["s"],
-            v=signed_fund_transaction["v"]
-        )
+        self._signature = {
+            "hash": signed_fund_transaction["hash"].hex(),
+            "rawTransaction": signed_fund_transaction["rawTransaction"].hex(),
+            "r": signed_fund_transaction["r"],
+            "s": signed_fund_transaction["s"],
+            "v": signed_fund_transaction["v"]
+        }
         self._type = "xinfin_xrc20_fund_signed" if self._xrc20 else "xinfin_fund_signed"
         return self
 
@@ -553,7 +789,8 @@ class WithdrawTransaction(Transaction):
         )
 
     def build_transaction(self, transaction_hash: str, address: str, secret_key: str,
-                          contract_address: Optional[str] = None) -> "WithdrawTransaction":
+                          contract_address: Optional[str] = None, htlc: Optional[HTLC] = None,
+                          gas: Optional[int] = None) -> "WithdrawTransaction":
         """
         Build XinFin withdraw transaction.
 
@@ -565,6 +802,10 @@ class WithdrawTransaction(Transaction):
         :type secret_key: str
         :param contract_address: XinFin HTLC contract address, defaults to ``None``.
         :type contract_address: str
+        :param htlc: XinFin HTLC instance to reuse instead of initializing a new one, defaults to ``None``.
+        :type htlc: xinfin.htlc.HTLC
+        :param gas: XinFin gas limit to skip gas estimation (like ``WITHDRAW_GAS``), defaults to ``None``.
+        :type gas: int
 
         :returns: WithdrawTransaction -- XinFin withdraw transaction instance.
 
@@ -579,17 +820,23 @@ class WithdrawTransaction(Transaction):
             raise AddressError(f"Invalid XinFin recipient '{address}' address.")
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
+        if htlc is not None and not isinstance(htlc, HTLC):
+            raise TypeError("Invalid XinFin HTLC instance, only takes XinFin HTLC class")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
-        )
+        if htlc is None:
+            htlc: HTLC = HTLC(
+                contract_address=contract_address, network=self._network, xrc20=self._xrc20
+            )
         htlc_contract: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
+            address=htlc.contract_address(prefix="0x"), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
+        checksum_address: str = to_checksum_address(address=address, prefix="0x")
+        # Get nonce, gas price and funded transaction receipt in one request
+        nonce, gas_price, transaction_receipt = self._get_transaction_parameters(
+            address=address, transaction_hash=transaction_hash
+        )
+        transaction_receipt: AttributeDict = _AttributeDict(transaction_receipt).__attribute_dict__()
         log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
             log=transaction_receipt["logs"][2 if self._xrc20 else 0]
         )
@@ -600,26 +847,10 @@ class WithdrawTransaction(Transaction):
             secret_key  # Secret Key
         )
 
-        self._fee = htlc_fund_function.estimateGas({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
-        })
-
-        self._transaction = htlc_fund_function.buildTransaction({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
-        })
-        self._type = "xinfin_xrc20_withdraw_unsigned" if self._xrc20 else "xinfin_withdraw_unsigned"
-        return self
+        return self._build_contract_transaction(
+            function=htlc_fund_function, address=checksum_address, value=_WEI_ZERO,
+            nonce=nonce, gas_price=gas_price, gas=gas, operation="withdraw"
+        )
 
     def sign(self, solver: WithdrawSolver) -> "WithdrawTransaction":
         """
@@ -644,18 +875,18 @@ class WithdrawTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin WithdrawSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_withdraw_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+        signed_withdraw_transaction: SignedTransaction = self._account.sign_transaction(
             transaction_dict=self._transaction,
             private_key=wallet.private_key()
         )
 
-        self._signature = dict(
-            hash=signed_withdraw_transaction["hash"].hex(),
-            rawTransaction=signed_withdraw_transaction["rawTransaction"].hex(),
-            r=signed_withdraw_transaction["r"],
-            s=signed_withdraw_transaction["s"],
-            v=signed_withdraw_transaction["v"]
-        )
+        self._signature = {
+            "hash": signed_withdraw_transaction["hash"].hex(),
+            "rawTransaction": signed_withdraw_transaction["rawTransaction"].hex(),
+            "r": signed_withdraw_transaction["r"],
+            "s": signed_withdraw_transaction["s"],
+            "v": signed_withdraw_transaction["v"]
+        }
         self._type = "xinfin_xrc20_withdraw_signed" if self._xrc20 else "xinfin_withdraw_signed"
         return self
 
@@ -683,7 +914,8 @@ class RefundTransaction(Transaction):
         )
 
     def build_transaction(self, transaction_hash: str, address: str,
-                          contract_address: Optional[str] = None) -> "RefundTransaction":
+                          contract_address: Optional[str] = None, htlc: Optional[HTLC] = None,
+                          gas: Optional[int] = None) -> "RefundTransaction":
         """
         Build XinFin refund transaction.
 
@@ -693,6 +925,10 @@ class RefundTransaction(Transaction):
         :type address: str
         :param contract_address: XinFin HTLC contract address, defaults to ``None``.
         :type contract_address: str
+        :param htlc: XinFin HTLC instance to reuse instead of initializing a new one, defaults to ``None``.
+        :type htlc: xinfin.htlc.HTLC
+        :param gas: XinFin gas limit to skip gas estimation (like ``REFUND_GAS``), defaults to ``None``.
+        :type gas: int
 
         :returns: RefundTransaction -- XinFin refund transaction instance.
 
@@ -707,17 +943,23 @@ class RefundTransaction(Transaction):
             raise AddressError(f"Invalid XinFin sender '{address}' address.")
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
+        if htlc is not None and not isinstance(htlc, HTLC):
+            raise TypeError("Invalid XinFin HTLC instance, only takes XinFin HTLC class")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
-        )
+        if htlc is None:
+            htlc: HTLC = HTLC(
+                contract_address=contract_address, network=self._network, xrc20=self._xrc20
+            )
         htlc_contract: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
+            address=htlc.contract_address(prefix="0x"), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
+        checksum_address: str = to_checksum_address(address=address, prefix="0x")
+        # Get nonce, gas price and funded transaction receipt in one request
+        nonce, gas_price, transaction_receipt = self._get_transaction_parameters(
+            address=address, transaction_hash=transaction_hash
+        )
+        transaction_receipt: AttributeDict = _AttributeDict(transaction_receipt).__attribute_dict__()
         log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
             log=transaction_receipt["logs"][2 if self._xrc20 else 0]
         )
@@ -727,26 +969,10 @@ class RefundTransaction(Transaction):
             locked_contract_id  # Locked Contract ID
         )
 
-        self._fee = htlc_refund_function.estimateGas({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
-        })
-
-        self._transaction = htlc_refund_function.buildTransaction({
-            "from": to_checksum_address(address=address, prefix="0x"),
-            "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
-        })
-        self._type = "xinfin_xrc20_refund_unsigned" if self._xrc20 else "xinfin_refund_unsigned"
-        return self
+        return self._build_contract_transaction(
+            function=htlc_refund_function, address=checksum_address, value=_WEI_ZERO,
+            nonce=nonce, gas_price=gas_price, gas=gas, operation="refund"
+        )
 
     def sign(self, solver: RefundSolver) -> "RefundTransaction":
         """
@@ -771,17 +997,27 @@ class RefundTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin RefundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_refund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+        signed_refund_transaction: SignedTransaction = self._account.sign_transaction(
             transaction_dict=self._transaction,
             private_key=wallet.private_key()
         )
 
-        self._signature = dict(
-            hash=signed_refund_transaction["hash"].hex(),
-            rawTransaction=signed_refund_transaction["rawTransaction"].hex(),
-            r=signed_refund_transaction["r"],
-            s=signed_refund_transaction["s"],
-            v=signed_refund_transaction["v"]
-        )
+        self._signature = {
+            "hash": signed_refund_transaction["hash"].hex(),
+            "rawTransaction": signed_refund_transaction["rawTransaction"].hex(),
+            "r": signed_refund_transaction["r"],
+            "s": signed_refund_transaction["s"],
+            "v": signed_refund_transaction["v"]
+        }
         self._type = "xinfin_xrc20_refund_signed" if self._xrc20 else "xinfin_refund_signed"
         return self
+
+
+# XinFin solver classes by transaction class, checked by bulk_sign
+_SOLVERS: dict = {
+    NormalTransaction: NormalSolver,
+    FundTransaction: FundSolver,
+    WithdrawTransaction: WithdrawSolver,
+    RefundTransaction: RefundSolver
+}
+
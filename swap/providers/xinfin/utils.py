@@ -3,7 +3,6 @@
 from base64 import b64decode
 from datetime import datetime
 from pyxdc.utils import (
-    is_address as _is_address,
     is_checksum_address as _is_checksum_address,
     to_checksum_address as _to_checksum_address
 )
@@ -11,11 +10,15 @@ from web3.types import ChecksumAddress
 from web3.datastructures import AttributeDict
 from hexbytes.main import HexBytes
 from web3 import Web3
-from typing import Union
+from functools import lru_cache
+from typing import (
+    Union, Pattern
+)
 
 import json
 import sys
 import os
+import re
 
 from ...utils import clean_transaction_raw
 from ...exceptions import (
@@ -23,6 +26,9 @@ from ...exceptions import (
 )
 from ..config import xinfin as config
 
+# XinFin address, 0x or xdc prefix followed by 20 bytes hex
+_ADDRESS_REGEX: Pattern = re.compile(r"(?:0x|xdc)([0-9a-fA-F]{40})")
+
 
 def is_network(network: str) -> bool:
     """
@@ -63,7 +69,14 @@ def is_address(address: str) -> bool:
     if not isinstance(address, str):
         raise TypeError(f"Address must be str, not '{type(address)}' type.")
 
-    return _is_address(address=address)
+    match = _ADDRESS_REGEX.fullmatch(address)
+    if match is None:
+        return False
+    # Mixed case addresses must match EIP-55 checksum
+    hex_address: str = match.group(1)
+    if hex_address == hex_address.lower() or hex_address == hex_address.upper():
+        return True
+    return _is_checksum_address(address=address)
 
 
 def is_checksum_address(address: str) -> bool:
@@ -89,6 +102,7 @@ def is_checksum_address(address: str) -> bool:
     return _is_checksum_address(address=address)
 
 
+@lru_cache(maxsize=4096)
 def to_checksum_address(address: str, prefix: str = "xdc") -> Union[str, ChecksumAddress]:
     """
     Change XinFin address to checksum address.
@@ -18,6 +18,9 @@ from .utils import (
 from .rpc import (
     get_balance, get_xrc20_balance
 )
+from ._backend import (
+    derive, load_xprivate_key
+)
 
 # Default derivation path
 DEFAULT_PATH: str = config["path"]
@@ -138,6 +141,27 @@ class Wallet(HDWallet):
         self._hdwallet.from_xprivate_key(xprivate_key=xprivate_key, strict=strict)
         return self
 
+    def from_xprivate_key_bytes(self, xprivate_key: bytes, strict: bool = True) -> "Wallet":
+        """
+        Master from Base58Check decoded Root XPrivate Key.
+
+        :param xprivate_key: XinFin decoded 78 bytes root xprivate key.
+        :type xprivate_key: bytes
+        :param strict: Strict for must be root xprivate key, default to ``True``.
+        :type strict: bool
+
+        :returns: Wallet -- XinFin wallet instance.
+
+        >>> from hdwallet.libs.base58 import check_decode
+        >>> from swap.providers.xinfin.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="mainnet")
+        >>> wallet.from_xprivate_key_bytes(xprivate_key=check_decode("xprv9s21ZrQH143K3Y3pdbkbjreZQ9RVmqTLhRgf86uZyCJk2ou36YdUJt5frjwihGWmV1fQEDioiGZXWXUbHLy3kQf5xmhvhp8dZ2tfn6tgGUj"))
+        <swap.providers.xinfin.wallet.Wallet object at 0x040DA268>
+        """
+
+        load_xprivate_key(hdwallet=self._hdwallet, xprivate_key=xprivate_key, strict=strict)
+        return self
+
     def from_xpublic_key(self, xpublic_key: str, strict: bool = True) -> "Wallet":
         """
         Master from Root XPublic Key.
@@ -210,7 +234,7 @@ class Wallet(HDWallet):
         <swap.providers.xinfin.wallet.Wallet object at 0x040DA268>
         """
 
-        self._hdwallet.from_path(path=path)
+        derive(hdwallet=self._hdwallet, path=path)
         return self
 
     def from_index(self, index: int, hardened: bool = False) -> "Wallet":
@@ -235,7 +259,10 @@ class Wallet(HDWallet):
         <swap.providers.xinfin.wallet.Wallet object at 0x040DA268>
         """
 
-        self._hdwallet.from_index(index=index, hardened=hardened)
+        if not isinstance(index, int):
+            raise ValueError("Bad index, Please import only integer number!")
+
+        derive(hdwallet=self._hdwallet, path=(f"m/{index}'" if hardened else f"m/{index}"))
         return self
 
     def clean_derivation(self) -> "Wallet":
@@ -325,8 +325,8 @@ def sha256(data: Union[str, bytes]) -> str:
     """
 
     if isinstance(data, str):
-        return hashlib.sha256(data.encode()).digest().hex()
-    return hashlib.sha256(data).digest().hex()
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
 
 
 def double_sha256(data: Union[str, bytes]) -> str:
@@ -341,7 +341,10 @@ def double_sha256(data: Union[str, bytes]) -> str:
     >>> double_sha256(data="Hello Meheret!")
     "821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e0158"
     """
-    return hashlib.sha256(unhexlify(sha256(data))).digest().hex()
+
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(hashlib.sha256(data).digest()).hexdigest()
 
 
 def clean_transaction_raw(transaction_raw: str) -> str:
@@ -1,17 +1,11 @@
 #!/usr/bin/env python3
 
-import json
-import os
-
 from swap.cli.__main__ import main as cli_main
 from swap.utils import clean_transaction_raw
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_bitcoin_cli_signature(cli_tester):
@@ -2,9 +2,36 @@
 
 from pathlib import Path
 from click.testing import CliRunner
+from typing import Optional
 
 import os
 import pytest
+import importlib
+
+from .values import load_values
+
+
+# Swap providers imported on pytest configure
+PROVIDERS: tuple = ("bitcoin", "bytom", "ethereum", "vapor", "xinfin")
+
+
+def pytest_configure(config):
+    # pytest-xdist workers get the controller's parsed values instead of parsing them again
+    workerinput: Optional[dict] = getattr(config, "workerinput", None)
+    load_values(values=workerinput.get("values") if workerinput is not None else None)
+    # Warm up the providers import graph (web3, btcpy, pybytom, ...) before collection,
+    # a provider that can't be imported only fails its own tests
+    for provider in PROVIDERS:
+        try:
+            importlib.import_module(f"swap.providers.{provider}.utils")
+        except ImportError:
+            continue
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # pytest-xdist controller hook, only called when it's installed
+    node.workerinput["values"] = load_values()
 
 
 @pytest.fixture(scope="module")
@@ -4,19 +4,14 @@ from btcpy.structs.sig import (
     P2pkhSolver, IfElseSolver
 )
 
-import json
-import os
 
 from swap.providers.bitcoin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_bitcoin_normal_solver():
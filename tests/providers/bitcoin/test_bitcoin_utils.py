@@ -1,52 +1,151 @@
 #!/usr/bin/env python3
 
+from typing import NamedTuple
+
 import pytest
 import requests
 import json
-import os
 
-from swap.exceptions import APIError
+from swap.exceptions import (
+    APIError, TransactionRawError
+)
 from swap.providers.bitcoin.utils import (
     is_network, is_address, is_transaction_raw, get_address_type,
-    decode_transaction_raw, submit_transaction_raw
+    decode_transaction_raw, submit_transaction_raw, _prepare_submission
 )
+from swap.providers.config import bitcoin as config
+from ...values import load_values
+
+
+class _Transaction(NamedTuple):
+    fee: int
+    transaction_raw: str
+    json: dict
+
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
+# Resolved Bitcoin test values
+NETWORK: str = _["bitcoin"]["network"]
+SENDER_ADDRESS: str = _["bitcoin"]["wallet"]["sender"]["address"]
+RECIPIENT_ADDRESS: str = _["bitcoin"]["wallet"]["recipient"]["address"]
+CONTRACT_ADDRESS: str = _["bitcoin"]["htlc"]["contract_address"]
+FUND_UNSIGNED: _Transaction = _Transaction(
+    **{field: _["bitcoin"]["fund"]["unsigned"][field] for field in _Transaction._fields}
+)
+TRANSACTION_RAW: str = FUND_UNSIGNED.transaction_raw
+ADDRESS_CASES: list = [
+    (SENDER_ADDRESS, None, True),
+    (SENDER_ADDRESS, "mainnet", False),
+    (SENDER_ADDRESS, NETWORK, True),
+    (RECIPIENT_ADDRESS, None, True),
+    (RECIPIENT_ADDRESS, "mainnet", False),
+    (RECIPIENT_ADDRESS, NETWORK, True),
+    (CONTRACT_ADDRESS, None, True),
+    (CONTRACT_ADDRESS, "mainnet", False),
+    (CONTRACT_ADDRESS, NETWORK, True)
+]
+NETWORK_CASES: list = [
+    (NETWORK, True),
+    ("unknown", False)
+]
+TRANSACTION_RAW_CASES: list = [
+    (TRANSACTION_RAW, True),
+    (f"\n  {TRANSACTION_RAW}\n", True),
+    ("unknown", False)
+]
+SUBMIT_REJECTION_CASES: list = [
+    ("sochain", 400, {
+        "status": "fail",
+        "data": {
+            "tx_hex": "16: mandatory-script-verify-flag-failed (Operation not valid with the current stack size)"
+        }
+    }),
+    ("smartbit", 400, {
+        "success": False,
+        "error": {
+            "code": "REQ_ERROR",
+            "message": "16: mandatory-script-verify-flag-failed (Operation not valid with the current stack size)"
+        }
+    })
+]
+ADDRESS_TYPE_CASES: list = [
+    (SENDER_ADDRESS, "p2pkh"),
+    (RECIPIENT_ADDRESS, "p2pkh"),
+    (CONTRACT_ADDRESS, "p2sh")
+]
 
 
-def test_bitcoin_utils():
+@pytest.mark.parametrize("network,valid", NETWORK_CASES)
+def test_bitcoin_utils_is_network(network, valid):
 
-    assert is_network(network=_["bitcoin"]["network"])
-    assert not is_network(network="unknown")
+    assert is_network(network=network) is valid
 
-    assert is_address(address=_["bitcoin"]["wallet"]["sender"]["address"])
-    assert not is_address(address=_["bitcoin"]["wallet"]["sender"]["address"], network="mainnet")
-    assert is_address(address=_["bitcoin"]["wallet"]["sender"]["address"], network=_["bitcoin"]["network"])
 
-    assert is_address(address=_["bitcoin"]["wallet"]["recipient"]["address"])
-    assert not is_address(address=_["bitcoin"]["wallet"]["recipient"]["address"], network="mainnet")
-    assert is_address(address=_["bitcoin"]["wallet"]["recipient"]["address"], network=_["bitcoin"]["network"])
+@pytest.mark.parametrize("address,network,valid", ADDRESS_CASES)
+def test_bitcoin_utils_is_address(address, network, valid):
 
-    assert is_transaction_raw(transaction_raw=_["bitcoin"]["fund"]["unsigned"]["transaction_raw"])
-    assert not is_transaction_raw(transaction_raw="unknown")
+    assert is_address(address=address, network=network) is valid
 
-    assert get_address_type(address=_["bitcoin"]["wallet"]["sender"]["address"]) == "p2pkh"
-    assert get_address_type(address=_["bitcoin"]["wallet"]["recipient"]["address"]) == "p2pkh"
-    assert get_address_type(address=_["bitcoin"]["htlc"]["contract_address"]) == "p2sh"
 
-    assert decode_transaction_raw(transaction_raw=_["bitcoin"]["fund"]["unsigned"]["transaction_raw"]) == \
-        {
-            "fee": _["bitcoin"]["fund"]["unsigned"]["fee"],
-            "network": _["bitcoin"]["network"],
-            "transaction": _["bitcoin"]["fund"]["unsigned"]["json"],
-            "type": "bitcoin_fund_unsigned"
-        }
+@pytest.mark.parametrize("transaction_raw,valid", TRANSACTION_RAW_CASES)
+def test_bitcoin_utils_is_transaction_raw(transaction_raw, valid):
+
+    assert is_transaction_raw(transaction_raw=transaction_raw) is valid
+
+
+@pytest.mark.parametrize("address,address_type", ADDRESS_TYPE_CASES)
+def test_bitcoin_utils_get_address_type(address, address_type):
+
+    assert get_address_type(address=address) == address_type
+
+
+def test_bitcoin_utils_decode_transaction_raw():
+
+    assert decode_transaction_raw(transaction_raw=TRANSACTION_RAW) == {
+        "fee": FUND_UNSIGNED.fee,
+        "network": NETWORK,
+        "transaction": FUND_UNSIGNED.json,
+        "type": "bitcoin_fund_unsigned"
+    }
+
+
+def test_bitcoin_utils_prepare_submission():
+
+    url, data, loaded_transaction_raw = _prepare_submission(transaction_raw=TRANSACTION_RAW)
+    assert url == config[NETWORK]["sochain"].format(links="send_tx")
+    # Unsigned transaction hex, which the node rejects with mandatory-script-verify-flag-failed
+    assert data == {"tx_hex": loaded_transaction_raw["raw"]}
+    assert loaded_transaction_raw["type"] == "bitcoin_fund_unsigned"
+
+    url, data, loaded_transaction_raw = _prepare_submission(transaction_raw=TRANSACTION_RAW, endpoint="smartbit")
+    assert url == f"{config[NETWORK]['smartbit']}/pushtx"
+    assert data == {"hex": loaded_transaction_raw["raw"]}
+
+    with pytest.raises(TransactionRawError, match="Invalid Bitcoin transaction raw"):
+        _prepare_submission(transaction_raw="unknown")
+    with pytest.raises(TypeError, match="Invalid Bitcoin endpoint api name"):
+        _prepare_submission(transaction_raw=TRANSACTION_RAW, endpoint="unknown")
+
+
+@pytest.mark.parametrize("endpoint,status_code,response_json", SUBMIT_REJECTION_CASES)
+def test_bitcoin_utils_submit_transaction_raw(monkeypatch, endpoint, status_code, response_json):
+
+    def send(adapter, request, **kwargs) -> requests.Response:
+        response: requests.Response = requests.Response()
+        response.status_code, response.url, response.request = status_code, request.url, request
+        response._content = json.dumps(response_json).encode()
+        return response
+
+    # Answered by the transport adapter, requests runs as usual without opening any socket
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", send)
+    with pytest.raises(APIError, match="mandatory-script-verify-flag-failed"):
+        submit_transaction_raw(transaction_raw=TRANSACTION_RAW, endpoint=endpoint)
+
+
+@pytest.mark.network
+def test_bitcoin_utils_submit_transaction_raw_network():
 
     # (REQ_ERROR) 16: mandatory-script-verify-flag-failed (Operation not valid with the current stack size)
     with pytest.raises((APIError, requests.exceptions.ConnectionError)):
-        submit_transaction_raw(transaction_raw=_["bitcoin"]["fund"]["unsigned"]["transaction_raw"])
+        submit_transaction_raw(transaction_raw=TRANSACTION_RAW)
@@ -2,20 +2,15 @@
 
 import pytest
 import requests
-import json
-import os
 
 from swap.exceptions import APIError
 from swap.providers.bytom.rpc import (
     decode_raw, submit_raw
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_bytom_rpc():
@@ -1,18 +1,12 @@
 #!/usr/bin/env python3
 
-import json
-import os
-
 from swap.providers.bytom.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_bytom_normal_solver():
@@ -1,8 +1,5 @@
 #!/usr/bin/env python3
 
-import json
-import os
-
 from swap.providers.ethereum.signature import (
     Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature
 )
@@ -10,13 +7,10 @@ from swap.providers.ethereum.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from swap.utils import clean_transaction_raw
+from ....values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_ethereum_erc20_normal_signature():
@@ -1,21 +1,16 @@
 #!/usr/bin/env python3
 
 import pytest
-import json
-import os
 
 from swap.exceptions import TransactionRawError
 from swap.providers.ethereum.utils import (
     is_network, is_address, is_transaction_raw, get_erc20_data,
     decode_transaction_raw, submit_transaction_raw
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_ethereum_utils():
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+from requests.adapters import HTTPAdapter
+from typing import (
+    Callable, Optional, Union
+)
+
+import requests
+import pytest
+import json
+
+
+class RPCStub:
+    """
+    XinFin JSON-RPC node stub, answers requests sent through any requests HTTPAdapter.
+
+    Batch requests are answered in reverse order, like nodes are allowed to.
+    """
+
+    def __init__(self):
+        # Results by method, a callable gets the call params
+        self.results: dict = {
+            "eth_chainId": "0x33",
+            "eth_gasPrice": "0x4a817c800",
+            "eth_getTransactionCount": "0x2",
+            "eth_estimateGas": "0x21cc4",
+            "eth_blockNumber": "0x1"
+        }
+        # JSON-RPC errors by method
+        self.errors: dict = {}
+        # Whole response body, replaces the answers when it's set
+        self.response: Optional[Union[dict, list]] = None
+        # Sent request bodies, one per HTTP request
+        self.requests: list = []
+
+    def calls(self, method: str) -> list:
+        return [
+            call for body in self.requests for call in (body if isinstance(body, list) else [body])
+            if call["method"] == method
+        ]
+
+    def answer(self, call: dict) -> dict:
+        if call["method"] in self.errors:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": self.errors[call["method"]]}
+        result: Union[Callable, str, dict] = self.results[call["method"]]
+        return {
+            "jsonrpc": "2.0", "id": call["id"], "result": result(call["params"]) if callable(result) else result
+        }
+
+    def send(self, adapter: HTTPAdapter, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        body: Union[dict, list] = json.loads(request.body)
+        self.requests.append(body)
+        if self.response is not None:
+            content: Union[dict, list] = self.response
+        elif isinstance(body, list):
+            content = [self.answer(call) for call in reversed(body)]
+        else:
+            content = self.answer(body)
+
+        response: requests.Response = requests.Response()
+        response.status_code, response.url, response.request = 200, request.url, request
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(content).encode()
+        return response
+
+
+@pytest.fixture
+def rpc_stub(monkeypatch) -> RPCStub:
+    stub: RPCStub = RPCStub()
+    monkeypatch.setattr(HTTPAdapter, "send", lambda adapter, request, **kwargs: stub.send(
+        adapter, request, **kwargs
+    ))
+    return stub
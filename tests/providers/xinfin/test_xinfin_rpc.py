@@ -1,19 +1,15 @@
 #!/usr/bin/env python3
 
 import pytest
-import json
-import os
 
+from swap.exceptions import APIError
 from swap.providers.xinfin.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, batch_request, get_transaction_parameters
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_xinfin_rpc():
@@ -28,3 +24,38 @@ def test_xinfin_rpc():
             raw=_["ethereum"]["fund"]["signed"]["raw"],
             network=_["xinfin"]["network"]
         )
+
+
+def test_xinfin_rpc_batch_request(rpc_stub):
+
+    rpc_stub.results["eth_getTransactionCount"] = lambda params: "0x7" if params[0].endswith("1") else "0x9"
+
+    # Answered in reverse order, results are matched back to calls by id
+    assert batch_request(calls=[
+        ("eth_chainId", []),
+        ("eth_getTransactionCount", ["0x0000000000000000000000000000000000000001", "latest"]),
+        ("eth_getTransactionCount", ["0x0000000000000000000000000000000000000002", "latest"]),
+        ("eth_gasPrice", [])
+    ], network=_["xinfin"]["network"]) == ["0x33", "0x7", "0x9", "0x4a817c800"]
+    assert len(rpc_stub.requests) == 1
+
+    rpc_stub.errors["eth_gasPrice"] = {"code": -32601, "message": "the method eth_gasPrice does not exist"}
+    with pytest.raises(APIError, match="the method eth_gasPrice does not exist"):
+        batch_request(calls=[("eth_chainId", []), ("eth_gasPrice", [])], network=_["xinfin"]["network"])
+
+    rpc_stub.response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid request"}}
+    with pytest.raises(APIError, match="invalid request"):
+        batch_request(calls=[("eth_chainId", [])], network=_["xinfin"]["network"])
+
+    rpc_stub.response = {"jsonrpc": "2.0", "id": 0, "result": "0x33"}
+    with pytest.raises(APIError, match="Invalid XinFin JSON-RPC batch response."):
+        batch_request(calls=[("eth_chainId", [])], network=_["xinfin"]["network"])
+
+
+def test_xinfin_rpc_get_transaction_parameters(rpc_stub):
+
+    assert get_transaction_parameters(
+        address=_["xinfin"]["wallet"]["sender"]["address"], network=_["xinfin"]["network"]
+    ) == (2, 20000000000, None)
+    assert len(rpc_stub.requests) == 1
+    assert [call["method"] for call in rpc_stub.requests[0]] == ["eth_getTransactionCount", "eth_gasPrice"]
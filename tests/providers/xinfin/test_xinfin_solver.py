@@ -1,19 +1,15 @@
 #!/usr/bin/env python3
 
-import json
-import os
+import pytest
 
 from swap.providers.xinfin.wallet import Wallet
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_xinfin_normal_solver():
@@ -66,3 +62,47 @@ def test_xinfin_refund_solver():
     )
 
     assert isinstance(refund_solver.solve(network=_["xinfin"]["network"]), Wallet)
+
+
+def test_xinfin_solver_solve_fresh_wallet():
+
+    refund_wallet = RefundSolver(
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    ).solve(network=_["xinfin"]["network"])
+    # Deriving further on a solved wallet must not leak into later solves
+    refund_wallet.from_index(7)
+    fund_wallet = FundSolver(
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    ).solve(network=_["xinfin"]["network"])
+
+    assert fund_wallet is not refund_wallet
+    assert fund_wallet.path() == _["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    assert fund_wallet.private_key() == _["xinfin"]["wallet"]["sender"]["private_key"]
+    assert fund_wallet.address() == _["xinfin"]["wallet"]["sender"]["address"]
+
+
+def test_xinfin_solver_invalid_xprivate_key():
+
+    # The xprivate key is only decoded, and checked, when the solver is solved
+    normal_solver = NormalSolver(xprivate_key="xprvinvalid")
+
+    with pytest.raises(ValueError, match="checksum"):
+        normal_solver.solve(network=_["xinfin"]["network"])
+
+
+def test_xinfin_solver_solve_many():
+
+    wallets = RefundSolver.solve_many(
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        paths=[
+            _["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+            _["xinfin"]["wallet"]["recipient"]["derivation"]["path"]
+        ],
+        network=_["xinfin"]["network"]
+    )
+
+    assert len(wallets) == 2
+    assert wallets[0].address() == _["xinfin"]["wallet"]["sender"]["address"]
+    assert wallets[1].path() == _["xinfin"]["wallet"]["recipient"]["derivation"]["path"]
@@ -1,23 +1,20 @@
 #!/usr/bin/env python3
 
-import json
-import os
+import pytest
 
+from swap.exceptions import APIError
 from swap.providers.xinfin.htlc import HTLC
 from swap.providers.xinfin.transaction import (
-    NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction
+    NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction, FUND_GAS
 )
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from swap.utils import get_current_timestamp
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_xinfin_normal_transaction():
@@ -178,3 +175,75 @@ def test_xinfin_refund_transaction():
     assert isinstance(signed_refund_transaction.json(), dict)
     assert isinstance(signed_refund_transaction.signature(), dict)
     assert isinstance(signed_refund_transaction.transaction_raw(), str)
+
+
+def test_xinfin_bulk_sign_solver_type():
+
+    fund_solver = FundSolver(
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    with pytest.raises(TypeError, match="Solver must be XinFin RefundSolver, not FundSolver type."):
+        RefundTransaction.bulk_sign(
+            transactions=[RefundTransaction(network=_["xinfin"]["network"])], solver=fund_solver
+        )
+    with pytest.raises(TypeError, match="Solver must be XinFin WithdrawSolver, not FundSolver type."):
+        WithdrawTransaction.bulk_sign(
+            transactions=[WithdrawTransaction(network=_["xinfin"]["network"])], solver=fund_solver
+        )
+    with pytest.raises(ValueError, match="Transaction is none, build transaction first."):
+        FundTransaction.bulk_sign(
+            transactions=[FundTransaction(network=_["xinfin"]["network"])], solver=fund_solver
+        )
+
+
+def test_xinfin_build_many(rpc_stub):
+
+    # Estimated gas depends on the value, so every estimate must land on its own transaction
+    rpc_stub.results["eth_estimateGas"] = lambda params: hex(100_000 + int(params[0]["value"], 16))
+
+    htlc = HTLC(
+        contract_address=_["xinfin"]["htlc"]["contract_address"],
+        network=_["xinfin"]["network"]
+    ).build_htlc(
+        secret_hash=_["xinfin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["xinfin"]["wallet"]["recipient"]["address"],
+        sender_address=_["xinfin"]["wallet"]["sender"]["address"],
+        endtime=get_current_timestamp(plus=3600)
+    )
+    specs = [
+        dict(address=_["xinfin"]["wallet"]["sender"]["address"], htlc=htlc, amount=amount, unit="Wei")
+        for amount in [1000, 2000, 3000]
+    ]
+    specs.append(dict(specs[0], gas=FUND_GAS))
+
+    fund_transactions = FundTransaction.build_many(specs=specs, network=_["xinfin"]["network"])
+
+    # One batch for parameters and one for gas estimates
+    assert len(rpc_stub.requests) == 2
+    assert len(rpc_stub.calls("eth_getTransactionCount")) == 1
+    assert len(rpc_stub.calls("eth_estimateGas")) == 3
+    # Same sender, consecutive nonces in specs order
+    assert [fund_transaction.json()["nonce"] for fund_transaction in fund_transactions] == [2, 3, 4, 5]
+    assert [fund_transaction.json()["chainId"] for fund_transaction in fund_transactions] == [51] * 4
+    # Same keys order as a transaction built with an explicit gas, so transaction raws are stable
+    assert [list(fund_transaction.json()) for fund_transaction in fund_transactions] == [
+        ["chainId", "from", "value", "nonce", "gas", "gasPrice", "to", "data"]
+    ] * 4
+    assert list(FundTransaction(network=_["xinfin"]["network"]).build_transaction(**specs[0]).json()) == [
+        "chainId", "from", "value", "nonce", "gas", "gasPrice", "to", "data"
+    ]
+    assert [fund_transaction.json()["gas"] for fund_transaction in fund_transactions] == [
+        101_000, 102_000, 103_000, FUND_GAS
+    ]
+    assert [fund_transaction.fee(unit="Wei") for fund_transaction in fund_transactions] == [
+        101_000, 102_000, 103_000, FUND_GAS
+    ]
+
+    rpc_stub.errors["eth_getTransactionCount"] = {"code": -32000, "message": "header not found"}
+    with pytest.raises(APIError, match="header not found"):
+        FundTransaction.build_many(specs=specs, network=_["xinfin"]["network"])
+
+    with pytest.raises(TypeError, match="Can't build many XinFin NormalTransaction"):
+        NormalTransaction.build_many(specs=[], network=_["xinfin"]["network"])
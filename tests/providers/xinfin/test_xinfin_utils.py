@@ -1,21 +1,16 @@
 #!/usr/bin/env python3
 
 import pytest
-import json
-import os
 
 from swap.exceptions import TransactionRawError
 from swap.providers.xinfin.utils import (
     is_network, is_address, is_transaction_raw, get_xrc20_data,
     decode_transaction_raw, submit_transaction_raw
 )
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_xinfin_utils():
@@ -25,6 +20,9 @@ def test_xinfin_utils():
 
     assert is_address(address=_["xinfin"]["wallet"]["sender"]["address"])
     assert is_address(address=_["xinfin"]["wallet"]["recipient"]["address"])
+    assert is_address(address=_["xinfin"]["wallet"]["sender"]["address"].lower())
+    assert not is_address(address="xdc" + _["xinfin"]["wallet"]["sender"]["address"][3:].swapcase())
+    assert not is_address(address=_["xinfin"]["wallet"]["sender"]["address"][:-1])
 
     assert is_transaction_raw(transaction_raw=_["xinfin"]["fund"]["unsigned"]["transaction_raw"])
     assert not is_transaction_raw(transaction_raw="unknown")
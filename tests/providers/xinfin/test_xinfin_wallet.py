@@ -1,16 +1,14 @@
 #!/usr/bin/env python3
 
-import json
-import os
+import pytest
+
+from hdwallet.libs.base58 import check_decode
 
 from swap.providers.xinfin.wallet import Wallet
+from ...values import load_values
 
 # Test Values
-base_path = os.path.dirname(__file__)
-file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
-values = open(file_path, "r")
-_ = json.loads(values.read())
-values.close()
+_ = load_values()
 
 
 def test_xinfin_wallet_from_entropy():
@@ -157,6 +155,34 @@ def test_xinfin_wallet_from_root_xprivate_key():
     # assert isinstance(wallet.balance(), int)
 
 
+def test_xinfin_wallet_from_root_xprivate_key_bytes():
+
+    wallet = Wallet(network=_["xinfin"]["network"])
+
+    wallet.from_xprivate_key_bytes(
+        xprivate_key=check_decode(_["xinfin"]["wallet"]["sender"]["root_xprivate_key"])
+    )
+
+    wallet.from_path(
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    assert wallet.root_xprivate_key() == _["xinfin"]["wallet"]["sender"]["root_xprivate_key"]
+    assert wallet.root_xpublic_key() == _["xinfin"]["wallet"]["sender"]["root_xpublic_key"]
+    assert wallet.xprivate_key() == _["xinfin"]["wallet"]["sender"]["xprivate_key"]
+    assert wallet.xpublic_key() == _["xinfin"]["wallet"]["sender"]["xpublic_key"]
+    assert wallet.private_key() == _["xinfin"]["wallet"]["sender"]["private_key"]
+    assert wallet.public_key() == _["xinfin"]["wallet"]["sender"]["public_key"]
+    assert wallet.finger_print() == _["xinfin"]["wallet"]["sender"]["finger_print"]
+    assert wallet.path() == _["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    assert wallet.address() == _["xinfin"]["wallet"]["sender"]["address"]
+
+    with pytest.raises(ValueError, match="Invalid root xprivate key."):
+        Wallet(network=_["xinfin"]["network"]).from_xprivate_key_bytes(
+            xprivate_key=check_decode(_["xinfin"]["wallet"]["sender"]["xprivate_key"])
+        )
+
+
 def test_xinfin_wallet_from_private_key():
 
     wallet = Wallet(network=_["xinfin"]["network"])
@@ -186,3 +212,68 @@ def test_xinfin_wallet_from_private_key():
     assert wallet.address() == _["xinfin"]["wallet"]["sender"]["address"]
 
     # assert isinstance(wallet.balance(), int)
+
+
+def test_xinfin_wallet_from_path_pure_python(monkeypatch):
+
+    monkeypatch.setattr("swap.providers.xinfin._backend.coincurve", None)
+
+    wallet = Wallet(network=_["xinfin"]["network"])
+
+    wallet.from_xprivate_key(
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"]
+    )
+
+    wallet.from_path(
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    assert wallet.xprivate_key() == _["xinfin"]["wallet"]["sender"]["xprivate_key"]
+    assert wallet.private_key() == _["xinfin"]["wallet"]["sender"]["private_key"]
+    assert wallet.finger_print() == _["xinfin"]["wallet"]["sender"]["finger_print"]
+    assert wallet.path() == _["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    assert wallet.address() == _["xinfin"]["wallet"]["sender"]["address"]
+
+
+def _derived(root_xprivate_key: str, path: str) -> tuple:
+    wallet = Wallet(network=_["xinfin"]["network"])
+    wallet.from_xprivate_key(xprivate_key=root_xprivate_key)
+    wallet.from_path(path=path)
+    derived = (
+        wallet.xprivate_key(), wallet.private_key(), wallet.chain_code(),
+        wallet.finger_print(), wallet.path(), wallet.address()
+    )
+    wallet.from_index(7)
+    return derived + (wallet.private_key(), wallet.path(), wallet.address())
+
+
+def test_xinfin_wallet_from_path_coincurve(monkeypatch):
+
+    pytest.importorskip("coincurve")
+
+    with monkeypatch.context() as context:
+        context.setattr("swap.providers.xinfin._backend.coincurve", None)
+        pure_python = _derived(
+            root_xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+        )
+
+    def from_path(self, path):
+        raise AssertionError("coincurve derivation fell back to HDWallet.from_path")
+
+    # Force the libsecp256k1 fast path, HDWallet's own derivation must not run
+    monkeypatch.setattr("hdwallet.HDWallet.from_path", from_path)
+    fast = _derived(
+        root_xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    assert fast == pure_python
+    assert fast[:6] == (
+        _["xinfin"]["wallet"]["sender"]["xprivate_key"],
+        _["xinfin"]["wallet"]["sender"]["private_key"],
+        _["xinfin"]["wallet"]["sender"]["chain_code"],
+        _["xinfin"]["wallet"]["sender"]["finger_print"],
+        _["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+        _["xinfin"]["wallet"]["sender"]["address"]
+    )
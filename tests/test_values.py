@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+import json
+
+from .values import (
+    VALUES_PATH, load_values
+)
+
+
+def test_values():
+
+    # Same as parsing values.json with json, over 64-bit integers included
+    assert load_values() == json.loads(VALUES_PATH.read_bytes())
+    assert isinstance(load_values()["ethereum"]["fund"]["signed"]["signature"]["r"], int)
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+
+from pathlib import Path
+from typing import Optional
+
+import json
+
+
+# Test values JSON
+VALUES_PATH: Path = Path(__file__).parent.joinpath("values.json")
+# Parsed test values, shared read-only by all test modules
+_values: Optional[dict] = None
+
+
+def load_values(values: Optional[dict] = None) -> dict:
+    # Test values are read and parsed once per pytest run, or given by the xdist controller
+    global _values
+    if values is not None:
+        _values = values
+    if _values is None:
+        # Parsed with json, orjson reads the over 64-bit signature integers as floats
+        _values = json.loads(VALUES_PATH.read_bytes())
+    return _values